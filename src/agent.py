@@ -28,12 +28,10 @@ from backend_llm import BackendLLM
 from interviewer import InterviewerAgent
 
 logger = logging.getLogger("agent")
-load_dotenv(".env.local")
 
 SUPPORTED_LANGUAGES = {"en", "vi"}
 
 server = AgentServer()
-_background_tasks: set[asyncio.Task] = set()
 
 
 def prewarm(proc: JobProcess):
@@ -41,6 +39,14 @@ def prewarm(proc: JobProcess):
         min_speech_duration=0.1,  # Min speech to register (filter brief noise)
         min_silence_duration=0.5,  # How long user must be quiet before VAD fires
     )
+    # Warm DNS for the backend host so the first get_interview_context call
+    # isn't a full cold start. warmup() uses its own short-lived client; the
+    # shared client must not be touched here because this temporary loop is
+    # gone by the time jobs run.
+    try:
+        asyncio.run(backend_client.warmup())
+    except Exception as e:
+        logger.warning("Backend warmup skipped: %s", e)
 
 
 server.setup_fnc = prewarm
@@ -55,7 +61,7 @@ async def send_to_frontend(room: rtc.Room, msg_type: str, data: dict):
             reliable=True,
         )
     except Exception as e:
-        logger.error(f"Failed to send to frontend: {e}")
+        logger.error("Failed to send to frontend: %s", e)
 
 
 def _create_stt(language: str):
@@ -106,7 +112,7 @@ def _detect_language(context: dict | None) -> str:
         return "en"
     lang = context.get("language", "en")
     if lang not in SUPPORTED_LANGUAGES:
-        logger.warning(f"Unsupported language '{lang}', falling back to English")
+        logger.warning("Unsupported language '%s', falling back to English", lang)
         return "en"
     return lang
 
@@ -115,7 +121,7 @@ def _detect_language(context: dict | None) -> str:
 async def interview_agent(ctx: JobContext):
     """Main agent session."""
     t_start = time.monotonic()
-    logger.info(f"[TIMING] Agent joining room: {ctx.room.name}")
+    logger.info("[TIMING] Agent joining room: %s", ctx.room.name)
 
     interview_id = backend_client.extract_interview_id(ctx.room.name)
 
@@ -126,11 +132,34 @@ async def interview_agent(ctx: JobContext):
         else None
     )
     language = _detect_language(context)
-    logger.info(f"Interview {interview_id}: language={language}")
+    logger.info("Interview %s: language=%s", interview_id, language)
 
     streaming_msg_id: str | None = None
     is_streaming = False
-    background_tasks = set()
+
+    # Frontend messages go through one bounded queue drained by a single
+    # sender coroutine: delivery stays ordered (transcript deltas must not
+    # reorder) and a slow data channel can't pile up unbounded
+    # fire-and-forget tasks in memory.
+    send_queue: asyncio.Queue[tuple[str, dict]] = asyncio.Queue(maxsize=256)
+
+    def enqueue_to_frontend(msg_type: str, data: dict) -> None:
+        try:
+            send_queue.put_nowait((msg_type, data))
+        except asyncio.QueueFull:
+            logger.warning("Frontend send queue full, dropping '%s' message", msg_type)
+
+    async def _drain_send_queue() -> None:
+        while True:
+            msg_type, data = await send_queue.get()
+            await send_to_frontend(ctx.room, msg_type, data)
+
+    sender_task = asyncio.create_task(_drain_send_queue())
+
+    async def _stop_sender() -> None:
+        sender_task.cancel()
+
+    ctx.add_shutdown_callback(_stop_sender)
 
     session = AgentSession(
         stt=_create_stt(language),
@@ -138,6 +167,13 @@ async def interview_agent(ctx: JobContext):
         tts=_create_tts(language),
         turn_detection=MultilingualModel(),
         vad=ctx.proc.userdata["vad"],
+        # Deliberately NOT preemptive: BackendLLM posts the user turn to the
+        # backend, which persists the conversation server-side. A speculative
+        # generation that the turn detector later discards only aborts the
+        # client-side stream — the backend has already committed the partial
+        # user turn (and possibly a ghost reply), so the stored transcript
+        # accumulates duplicated/fragmented turns. Revisit once the backend's
+        # voice-message turn commit is idempotent.
         preemptive_generation=False,
         min_endpointing_delay=0.4,
         max_endpointing_delay=3.0,
@@ -149,44 +185,44 @@ async def interview_agent(ctx: JobContext):
         if not interview_id:
             return
 
+        # Check content before anything else so text-less items (e.g. tool
+        # calls) exit in one branch
         item = event.item
-        if not hasattr(item, "role") or not hasattr(item, "content"):
+        raw_content = getattr(item, "content", None)
+        if not raw_content:
             return
 
-        role = "user" if item.role == "user" else "assistant"
+        # Only user/assistant turns belong in the transcript; tool and system
+        # items would otherwise be coerced to "assistant" and shown in the UI
+        role = getattr(item, "role", None)
+        if role not in ("user", "assistant"):
+            return
 
-        # Extract content
-        content = ""
-        if isinstance(item.content, str):
-            content = item.content
-        elif isinstance(item.content, list):
-            for part in item.content:
-                if hasattr(part, "text"):
-                    content += part.text
-                elif isinstance(part, str):
-                    content += part
+        # Extract content — join once instead of repeated string concatenation
+        if isinstance(raw_content, str):
+            content = raw_content
+        else:
+            content = "".join(
+                part.text if hasattr(part, "text") else part
+                for part in raw_content
+                if hasattr(part, "text") or isinstance(part, str)
+            )
 
         if not content.strip():
             return
 
-        logger.info(f"{role} message: {content[:60]}...")
-
-        async def send_to_ui():
-            msg_id = f"{role}-{asyncio.get_event_loop().time()}"
-            await send_to_frontend(
-                ctx.room,
-                "transcript",
-                {
-                    "role": role,
-                    "content": content,
-                    "messageId": msg_id,
-                    "timestamp": asyncio.get_event_loop().time(),
-                },
-            )
-
-        task = asyncio.create_task(send_to_ui())
-        background_tasks.add(task)
-        task.add_done_callback(background_tasks.discard)
+        logger.info("%s message: %.60s...", role, content)
+
+        now = asyncio.get_event_loop().time()
+        enqueue_to_frontend(
+            "transcript",
+            {
+                "role": role,
+                "content": content,
+                "messageId": f"{role}-{now}",
+                "timestamp": now,
+            },
+        )
 
     @session.on("generation_chunk")
     def on_generation_chunk(event):
@@ -212,23 +248,12 @@ async def interview_agent(ctx: JobContext):
         if not is_streaming:
             is_streaming = True
             streaming_msg_id = f"stream-{asyncio.get_event_loop().time()}"
+            enqueue_to_frontend("agent_status", {"status": "typing_start"})
 
-            t = asyncio.create_task(
-                send_to_frontend(ctx.room, "agent_status", {"status": "typing_start"})
-            )
-            background_tasks.add(t)
-            t.add_done_callback(background_tasks.discard)
-
-        async def send_delta():
-            await send_to_frontend(
-                ctx.room,
-                "transcript_delta",
-                {"role": "assistant", "delta": text, "messageId": streaming_msg_id},
-            )
-
-        task = asyncio.create_task(send_delta())
-        background_tasks.add(task)
-        task.add_done_callback(background_tasks.discard)
+        enqueue_to_frontend(
+            "transcript_delta",
+            {"role": "assistant", "delta": text, "messageId": streaming_msg_id},
+        )
 
     @session.on("generation_done")
     def on_generation_done(event):
@@ -236,16 +261,7 @@ async def interview_agent(ctx: JobContext):
         nonlocal is_streaming, streaming_msg_id
 
         if is_streaming:
-
-            async def send_done():
-                await send_to_frontend(
-                    ctx.room, "agent_status", {"status": "typing_end"}
-                )
-
-            task = asyncio.create_task(send_done())
-            background_tasks.add(task)
-            task.add_done_callback(background_tasks.discard)
-
+            enqueue_to_frontend("agent_status", {"status": "typing_end"})
             is_streaming = False
             streaming_msg_id = None
 
@@ -254,8 +270,9 @@ async def interview_agent(ctx: JobContext):
     interviewer = InterviewerAgent(interview_id=interview_id, language=language)
     t_after_agent = time.monotonic()
     logger.info(
-        f"[TIMING] InterviewerAgent init: {(t_after_agent - t_before_agent):.2f}s "
-        f"(total: {(t_after_agent - t_start):.2f}s)"
+        "[TIMING] InterviewerAgent init: %.2fs (total: %.2fs)",
+        t_after_agent - t_before_agent,
+        t_after_agent - t_start,
     )
 
     t_before_start = time.monotonic()
@@ -265,16 +282,20 @@ async def interview_agent(ctx: JobContext):
         room_options=room_io.RoomOptions(
             close_on_disconnect=False,  # Keep agent alive on brief disconnects (F5, network blip)
             audio_input=room_io.AudioInputOptions(
-                noise_cancellation=lambda params: noise_cancellation.BVCTelephony()
-                if params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP
-                else noise_cancellation.BVC(),
+                noise_cancellation=lambda params: (
+                    noise_cancellation.BVCTelephony()
+                    if params.participant.kind
+                    == rtc.ParticipantKind.PARTICIPANT_KIND_SIP
+                    else noise_cancellation.BVC()
+                ),
             ),
         ),
     )
     t_after_start = time.monotonic()
     logger.info(
-        f"[TIMING] session.start (incl. on_enter greeting): "
-        f"{(t_after_start - t_before_start):.2f}s (total: {(t_after_start - t_start):.2f}s)"
+        "[TIMING] session.start (incl. on_enter greeting): %.2fs (total: %.2fs)",
+        t_after_start - t_before_start,
+        t_after_start - t_start,
     )
 
     await ctx.connect()
@@ -282,10 +303,12 @@ async def interview_agent(ctx: JobContext):
     # Send ready status
     await send_to_frontend(ctx.room, "agent_status", {"status": "ready"})
     logger.info(
-        f"[TIMING] Agent fully ready: {(time.monotonic() - t_start):.2f}s total | "
-        f"room: {ctx.room.name}"
+        "[TIMING] Agent fully ready: %.2fs total | room: %s",
+        time.monotonic() - t_start,
+        ctx.room.name,
     )
 
 
 if __name__ == "__main__":
+    load_dotenv(".env.local")
     cli.run_app(server)
@@ -18,15 +18,31 @@ AUTHENTICATION:
 - Must match the INTERNAL_API_KEY configured in sfinx-backend
 """
 
+import asyncio
 import logging
 import os
+import re
 import time
 from typing import Any
 
 import httpx
+import orjson
 
 logger = logging.getLogger("backend_client")
 
+# Context cache bounds — long-lived workers must not accumulate every
+# interview they have ever served.
+_CACHE_MAX_ENTRIES = 256
+_CACHE_TTL_SECONDS = 3600.0
+
+# Room names follow interview-{uuid}; compiled once so extraction both
+# validates the id and avoids per-call pattern compilation.
+_ROOM_RE = re.compile(
+    r"^interview-"
+    r"([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}"
+    r"-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
 
 class BackendClient:
     """Client for communicating with sfinx-backend API"""
@@ -34,28 +50,82 @@ class BackendClient:
     def __init__(self):
         self.base_url = os.getenv("BACKEND_URL", "http://localhost:3000")
         self.api_key = os.getenv("INTERNAL_API_KEY", "")
-        self._context_cache: dict[str, dict] = {}
+        # interview_id -> (stored_at, context); bounded by size and TTL
+        self._context_cache: dict[str, tuple[float, dict]] = {}
+        # Built once — identical for every request
+        self._headers_cached = {
+            "x-api-key": self.api_key,
+            "Content-Type": "application/json",
+        }
         # Persistent client — reuses TCP connections across all calls so there
-        # is no per-request handshake overhead.
+        # is no per-request handshake overhead. base_url and headers are set
+        # once here so the hot-path calls only pass a relative path.
         self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._headers_cached,
             timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
         )
 
     def _headers(self) -> dict[str, str]:
-        """Generate request headers with API key"""
-        return {
-            "x-api-key": self.api_key,
-            "Content-Type": "application/json",
-        }
+        """Request headers with API key (shared constant dict)"""
+        return self._headers_cached
 
     def extract_interview_id(self, room_name: str) -> str | None:
         """
-        Extract interview ID from room name.
-        Room names follow format: interview-{uuid}
+        Extract and validate the interview ID from a room name.
+        Room names follow format: interview-{uuid}; anything else
+        (including a malformed id) returns None so we never hit the
+        backend with garbage.
         """
-        if room_name.startswith("interview-"):
-            return room_name.replace("interview-", "")
-        return None
+        match = _ROOM_RE.match(room_name)
+        return match.group(1) if match else None
+
+    async def _post_with_retry(
+        self, path: str, *, content: bytes, timeout: float = 10.0, attempts: int = 3
+    ) -> httpx.Response:
+        """
+        POST with retries for transient failures (5xx, transport errors).
+
+        Backoff is 100ms doubling per attempt. Retries reuse the persistent
+        client's established connection, so they cost milliseconds rather
+        than a fresh TCP/TLS handshake. Non-retryable responses (4xx etc.)
+        are returned to the caller as-is; the last transport error is
+        re-raised once attempts are exhausted.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.post(
+                    path, content=content, timeout=timeout
+                )
+            # TransportError covers timeouts and connection failures;
+            # anything else (e.g. a malformed request) is not worth retrying
+            except httpx.TransportError:
+                if attempt >= attempts - 1:
+                    raise
+            else:
+                retryable = response.status_code in (500, 502, 503, 504)
+                if not retryable or attempt >= attempts - 1:
+                    return response
+            await asyncio.sleep(0.1 * 2**attempt)
+            attempt += 1
+
+    def _cache_store(self, interview_id: str, data: dict) -> None:
+        """Insert into the context cache, evicting expired then oldest entries."""
+        now = time.monotonic()
+        if len(self._context_cache) >= _CACHE_MAX_ENTRIES:
+            expired = [
+                key
+                for key, (stored_at, _) in self._context_cache.items()
+                if now - stored_at >= _CACHE_TTL_SECONDS
+            ]
+            for key in expired:
+                del self._context_cache[key]
+            # Still full: drop the oldest insertion (dicts preserve order)
+            while len(self._context_cache) >= _CACHE_MAX_ENTRIES:
+                del self._context_cache[next(iter(self._context_cache))]
+        self._context_cache[interview_id] = (now, data)
 
     async def get_interview_context(self, interview_id: str) -> dict[str, Any] | None:
         """
@@ -69,45 +139,52 @@ class BackendClient:
 
         The response is cached to avoid repeated API calls during a session.
         """
-        if interview_id in self._context_cache:
-            logger.info(f"Using cached context for interview: {interview_id}")
-            return self._context_cache[interview_id]
-
-        url = f"{self.base_url}/internal/ai-interviews/{interview_id}/context"
-        logger.info(f"Fetching context from: {url}")
+        if not interview_id:
+            return None
+
+        entry = self._context_cache.get(interview_id)
+        if entry is not None:
+            stored_at, data = entry
+            if time.monotonic() - stored_at < _CACHE_TTL_SECONDS:
+                logger.info("Using cached context for interview: %s", interview_id)
+                return data
+            del self._context_cache[interview_id]
+
+        path = f"/internal/ai-interviews/{interview_id}/context"
+        logger.info("Fetching context from: %s%s", self.base_url, path)
         t0 = time.monotonic()
 
         try:
-            response = await self._client.get(
-                url,
-                headers=self._headers(),
-                timeout=10.0,
-            )
+            response = await self._client.get(path, timeout=10.0)
 
             elapsed = time.monotonic() - t0
             logger.info(
-                f"Context response status: {response.status_code} "
-                f"(HTTP latency: {elapsed:.2f}s)"
+                "Context response status: %s (HTTP latency: %.2fs)",
+                response.status_code,
+                elapsed,
             )
 
             if response.status_code == 200:
-                raw_response = response.json()
+                raw_response = orjson.loads(response.content)
                 # Unwrap { data: {...} } wrapper from NestJS response
                 data = raw_response.get("data", raw_response)
                 if "error" not in data:
-                    self._context_cache[interview_id] = data
+                    self._cache_store(interview_id, data)
                     logger.info(
-                        f"Context loaded - Problem: {data.get('problemSnapshot', {}).get('title', 'Unknown')}"
+                        "Context loaded - Problem: %s",
+                        (data.get("problemSnapshot") or {}).get("title", "Unknown"),
                     )
                     return data
-                logger.error(f"Backend error: {data.get('error')}")
+                logger.error("Backend error: %s", data.get("error"))
             else:
                 logger.error(
-                    f"Failed to fetch context: {response.status_code} - {response.text}"
+                    "Failed to fetch context: %s - %s",
+                    response.status_code,
+                    response.text,
                 )
 
         except Exception as e:
-            logger.exception(f"Error fetching interview context: {e}")
+            logger.exception("Error fetching interview context: %s", e)
 
         return None
 
@@ -131,21 +208,24 @@ class BackendClient:
         - Continuity if user switches to text mode
         """
         try:
-            response = await self._client.post(
-                f"{self.base_url}/internal/ai-interviews/{interview_id}/transcript",
-                headers=self._headers(),
-                json={"role": role, "content": content},
-                timeout=10.0,
+            response = await self._post_with_retry(
+                f"/internal/ai-interviews/{interview_id}/transcript",
+                content=orjson.dumps({"role": role, "content": content}),
             )
 
-            if response.status_code in (200, 201):
+            if 200 <= response.status_code < 300:
                 return True
-            logger.error(
-                f"Failed to store transcript: {response.status_code} - {response.text}"
-            )
+            # Guarded so response.text (which decodes the body) is only
+            # evaluated when error logging is actually enabled
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Failed to store transcript: %s - %s",
+                    response.status_code,
+                    response.text,
+                )
 
         except Exception as e:
-            logger.exception(f"Error storing transcript: {e}")
+            logger.exception("Error storing transcript: %s", e)
 
         return False
 
@@ -153,8 +233,7 @@ class BackendClient:
         """Send a voice message through the backend LLM pipeline."""
         try:
             response = await self._client.post(
-                f"{self.base_url}/internal/ai-interviews/{interview_id}/voice-message",
-                headers=self._headers(),
+                f"/internal/ai-interviews/{interview_id}/voice-message",
                 json={"content": content},
                 timeout=15.0,
             )
@@ -163,18 +242,17 @@ class BackendClient:
                 data = raw.get("data", raw)
                 return data.get("content", "")
             logger.error(
-                f"voice_message failed: {response.status_code} - {response.text}"
+                "voice_message failed: %s - %s", response.status_code, response.text
             )
         except Exception as e:
-            logger.exception(f"Error in voice_message: {e}")
+            logger.exception("Error in voice_message: %s", e)
         return "I'm sorry, I couldn't generate a response."
 
     async def voice_start(self, interview_id: str) -> str:
         """Generate an opening greeting through the backend LLM pipeline."""
         try:
             response = await self._client.post(
-                f"{self.base_url}/internal/ai-interviews/{interview_id}/voice-start",
-                headers=self._headers(),
+                f"/internal/ai-interviews/{interview_id}/voice-start",
                 timeout=15.0,
             )
             if response.status_code in (200, 201):
@@ -182,12 +260,39 @@ class BackendClient:
                 data = raw.get("data", raw)
                 return data.get("content", "")
             logger.error(
-                f"voice_start failed: {response.status_code} - {response.text}"
+                "voice_start failed: %s - %s", response.status_code, response.text
             )
         except Exception as e:
-            logger.exception(f"Error in voice_start: {e}")
+            logger.exception("Error in voice_start: %s", e)
         return "Hello! Welcome to your coding interview. Are you ready to begin?"
 
+    async def warmup(self):
+        """
+        Warm OS-level DNS/route caches for the backend host before the first
+        job arrives.
+
+        Uses a throwaway client that is fully closed here: prewarm runs on a
+        temporary event loop before the job process's own loop exists, so
+        touching the shared client's pool from it would leave keep-alive
+        connections bound to a closed loop. Any response (even 404) is fine;
+        failures are logged and ignored.
+        """
+        try:
+            t0 = time.monotonic()
+            async with httpx.AsyncClient(base_url=self.base_url, timeout=3.0) as client:
+                response = await client.get("/healthz")
+            logger.info(
+                "Backend warmup: %s in %.2fs",
+                response.status_code,
+                time.monotonic() - t0,
+            )
+        except Exception as e:
+            logger.warning("Backend warmup failed (non-fatal): %s", e)
+
+    async def aclose(self):
+        """Close the underlying connection pool (worker shutdown)."""
+        await self._client.aclose()
+
     def clear_cache(self, interview_id: str | None = None):
         """Clear cached context (useful when interview ends)"""
         if interview_id:
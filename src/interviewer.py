@@ -41,6 +41,12 @@ from livekit.agents import Agent, RunContext, function_tool
 logger = logging.getLogger("interviewer")
 
 
+_HINT_GUIDANCE = {
+    "gentle": "Give a subtle nudge without revealing the solution approach",
+    "moderate": "Provide more specific guidance about the approach to consider",
+    "strong": "Give substantial help but still let them implement it",
+}
+
 _GREETING_INSTRUCTIONS = {
     "en": (
         "Greet the candidate warmly and ask if they are ready to begin "
@@ -68,8 +74,9 @@ class InterviewerAgent(Agent):
         self.language = language
         super().__init__(instructions="")
         logger.info(
-            f"InterviewerAgent initialized for interview: {interview_id or 'unknown'} "
-            f"(language={language})"
+            "InterviewerAgent initialized for interview: %s (language=%s)",
+            interview_id or "unknown",
+            language,
         )
 
     async def on_enter(self) -> None:
@@ -80,7 +87,7 @@ class InterviewerAgent(Agent):
         )
         await self.session.generate_reply(instructions=instructions)
         elapsed = time.monotonic() - t0
-        logger.info(f"[TIMING] on_enter generate_reply (LLM+TTS+audio): {elapsed:.2f}s")
+        logger.info("[TIMING] on_enter generate_reply (LLM+TTS+audio): %.2fs", elapsed)
 
     @function_tool
     async def provide_hint(
@@ -99,15 +106,9 @@ class InterviewerAgent(Agent):
                        'moderate' (more specific guidance), or
                        'strong' (nearly giving away the approach)
         """
-        logger.info(f"Providing {hint_level} hint for interview {self.interview_id}")
-
-        hint_guidance = {
-            "gentle": "Give a subtle nudge without revealing the solution approach",
-            "moderate": "Provide more specific guidance about the approach to consider",
-            "strong": "Give substantial help but still let them implement it",
-        }
+        logger.info("Providing %s hint for interview %s", hint_level, self.interview_id)
 
-        guidance = hint_guidance.get(hint_level, hint_guidance["gentle"])
+        guidance = _HINT_GUIDANCE.get(hint_level, _HINT_GUIDANCE["gentle"])
         return f"[Internal: {guidance}]"
 
     @function_tool
@@ -118,7 +119,7 @@ class InterviewerAgent(Agent):
         Use this to give the candidate feedback on what they've accomplished
         and what remains to be done.
         """
-        logger.info(f"Summarizing progress for interview {self.interview_id}")
+        logger.info("Summarizing progress for interview %s", self.interview_id)
         return (
             "[Internal: Summarize what the candidate has accomplished and what's left]"
         )
@@ -139,7 +140,9 @@ class InterviewerAgent(Agent):
                        'time_complexity', 'space_complexity', or 'readability'
         """
         logger.info(
-            f"Requesting code review for {focus_area} in interview {self.interview_id}"
+            "Requesting code review for %s in interview %s",
+            focus_area,
+            self.interview_id,
         )
         return (
             f"[Internal: Ask candidate to explain their code focusing on {focus_area}]"
@@ -18,22 +18,26 @@ TEST CATEGORIES:
 """
 
 import pytest
+import pytest_asyncio
 from livekit.agents import AgentSession, inference, llm
 
 from interviewer import InterviewerAgent
 
+# All tests in this module run on one event loop so they can share a single
+# LLM connection instead of paying the inference setup per test.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-def _llm() -> llm.LLM:
-    return inference.LLM(model="openai/gpt-4.1-mini")
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_llm():
+    """One inference.LLM connection reused by every test in this module."""
+    async with inference.LLM(model="openai/gpt-4.1-mini") as llm_instance:
+        yield llm_instance
 
-@pytest.mark.asyncio
-async def test_professional_greeting() -> None:
+
+async def test_professional_greeting(shared_llm: llm.LLM) -> None:
     """Agent should greet the candidate professionally for an interview."""
-    async with (
-        _llm() as llm_instance,
-        AgentSession(llm=llm_instance) as session,
-    ):
+    async with AgentSession(llm=shared_llm) as session:
         agent = InterviewerAgent(interview_id="test-123")
         await session.start(agent)
 
@@ -43,7 +47,7 @@ async def test_professional_greeting() -> None:
             result.expect.next_event()
             .is_message(role="assistant")
             .judge(
-                llm_instance,
+                shared_llm,
                 intent="""
                 Greets the candidate professionally for a coding interview.
 
@@ -62,13 +66,9 @@ async def test_professional_greeting() -> None:
         result.expect.no_more_events()
 
 
-@pytest.mark.asyncio
-async def test_guides_without_giving_answer() -> None:
+async def test_guides_without_giving_answer(shared_llm: llm.LLM) -> None:
     """Agent should guide the candidate without revealing the solution."""
-    async with (
-        _llm() as llm_instance,
-        AgentSession(llm=llm_instance) as session,
-    ):
+    async with AgentSession(llm=shared_llm) as session:
         agent = InterviewerAgent(interview_id="test-123")
         await session.start(agent)
 
@@ -80,7 +80,7 @@ async def test_guides_without_giving_answer() -> None:
             result.expect.next_event()
             .is_message(role="assistant")
             .judge(
-                llm_instance,
+                shared_llm,
                 intent="""
                 Guides the candidate without giving away the answer.
 
@@ -100,13 +100,9 @@ async def test_guides_without_giving_answer() -> None:
         result.expect.no_more_events()
 
 
-@pytest.mark.asyncio
-async def test_asks_clarifying_questions() -> None:
+async def test_asks_clarifying_questions(shared_llm: llm.LLM) -> None:
     """Agent should ask clarifying questions about the candidate's approach."""
-    async with (
-        _llm() as llm_instance,
-        AgentSession(llm=llm_instance) as session,
-    ):
+    async with AgentSession(llm=shared_llm) as session:
         agent = InterviewerAgent(interview_id="test-123")
         await session.start(agent)
 
@@ -116,7 +112,7 @@ async def test_asks_clarifying_questions() -> None:
             result.expect.next_event()
             .is_message(role="assistant")
             .judge(
-                llm_instance,
+                shared_llm,
                 intent="""
                 Asks a clarifying question or encourages elaboration.
 
@@ -140,13 +136,9 @@ async def test_asks_clarifying_questions() -> None:
         result.expect.no_more_events()
 
 
-@pytest.mark.asyncio
-async def test_handles_off_topic() -> None:
+async def test_handles_off_topic(shared_llm: llm.LLM) -> None:
     """Agent should handle off-topic questions professionally."""
-    async with (
-        _llm() as llm_instance,
-        AgentSession(llm=llm_instance) as session,
-    ):
+    async with AgentSession(llm=shared_llm) as session:
         agent = InterviewerAgent(interview_id="test-123")
         await session.start(agent)
 
@@ -156,7 +148,7 @@ async def test_handles_off_topic() -> None:
             result.expect.next_event()
             .is_message(role="assistant")
             .judge(
-                llm_instance,
+                shared_llm,
                 intent="""
                 Handles off-topic question professionally and redirects.
 
@@ -174,13 +166,9 @@ async def test_handles_off_topic() -> None:
         result.expect.no_more_events()
 
 
-@pytest.mark.asyncio
-async def test_concise_voice_responses() -> None:
+async def test_concise_voice_responses(shared_llm: llm.LLM) -> None:
     """Agent should provide concise responses suitable for voice."""
-    async with (
-        _llm() as llm_instance,
-        AgentSession(llm=llm_instance) as session,
-    ):
+    async with AgentSession(llm=shared_llm) as session:
         agent = InterviewerAgent(interview_id="test-123")
         await session.start(agent)
 
@@ -190,7 +178,7 @@ async def test_concise_voice_responses() -> None:
             result.expect.next_event()
             .is_message(role="assistant")
             .judge(
-                llm_instance,
+                shared_llm,
                 intent="""
                 Provides a concise explanation suitable for voice conversation.
 